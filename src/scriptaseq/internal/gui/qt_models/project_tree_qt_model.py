@@ -185,8 +185,10 @@ class ProjectTreeQtModel(QAbstractItemModel):
         
         # Rename the node.
         try:
-          self._undo_stack.push(RenameProjectTreeNodeCommand(self._project_tree_controller, self.qt_index_to_node(index),
-            value))
+          command = RenameProjectTreeNodeCommand.try_create(self._project_tree_controller,
+            self.qt_index_to_node(index), value)
+          if command is not None:
+            self._undo_stack.push(command)
           return True
         
         # Renaming may fail due to the name being invalid or unavailable.
@@ -254,7 +256,9 @@ class ProjectTreeQtModel(QAbstractItemModel):
       try:
         node = self._root_node.resolve_path(decode_project_tree_node_path(data.data(PROJECT_TREE_NODE_PATH_MEDIA_TYPE)))
         new_parent_node = self.qt_index_to_node(parent)
-        self._undo_stack.push(ReparentProjectTreeNodeCommand(self._project_tree_controller, node, new_parent_node))
+        command = ReparentProjectTreeNodeCommand.try_create(self._project_tree_controller, node, new_parent_node)
+        if command is not None:
+          self._undo_stack.push(command)
         return True
       except ValueError:
         return False
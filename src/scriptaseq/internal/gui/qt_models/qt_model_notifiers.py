@@ -4,10 +4,13 @@ class DoNothingNotifier:
   """Class that behaves like the other change notifier classes, but does nothing before or after the change."""
   
   def __enter__(self):
-    pass
+    return self
   
-  def __exit__(self):
-    pass
+  def __exit__(self, exc_type, exc_value, exc_traceback):
+    return False
+
+# Shared DoNothingNotifier instance. The class is stateless, so there is no need to create a new one for each change.
+DO_NOTHING_NOTIFIER = DoNothingNotifier()
 
 class ResetModelNotifier:
   """Class that calls appropriate methods to notify a QAbstractItemModel's views that the model is being reset.
@@ -3,8 +3,8 @@
 from PyQt5 import QtCore
 from PyQt5.Qt import QAbstractItemModel, QModelIndex, QVariant, QCoreApplication, QMimeData
 
-from scriptaseq.internal.gui.qt_models.qt_model_notifiers import DoNothingNotifier, AddNodeNotifier, DeleteNodeNotifier, \
-  MoveNodeNotifier, ResetModelNotifier
+from scriptaseq.internal.gui.qt_models.qt_model_notifiers import DO_NOTHING_NOTIFIER, AddNodeNotifier, \
+  DeleteNodeNotifier, MoveNodeNotifier, ResetModelNotifier
 from scriptaseq.internal.gui.undo_commands.seq_component_tree import RenameSequenceComponentTreeNodeCommand, \
   ReparentSequenceComponentTreeNodeCommand
 from scriptaseq.internal.mime_data import SEQUENCE_COMPONENT_TREE_NODE_PATH_MEDIA_TYPE, encode_seq_component_tree_node_path, \
@@ -90,7 +90,7 @@ class SequenceComponentTreeQtModel(QAbstractItemModel):
     # No special operations are required if the sequence component tree being modified is not the one this Qt model is
     # showing.
     if self._project_tree_controller.active_node is not node_to_add.tree_owner:
-      return DoNothingNotifier()
+      return DO_NOTHING_NOTIFIER
     
     return AddNodeNotifier(self, self.node_to_qt_index(parent), parent.child_idx_from_name(node_to_add.name))
   
@@ -109,7 +109,7 @@ class SequenceComponentTreeQtModel(QAbstractItemModel):
     # No special operations are required if the sequence component tree being modified is not the one this Qt model is
     # showing.
     if self._project_tree_controller.active_node is not node_to_delete.tree_owner:
-      return DoNothingNotifier()
+      return DO_NOTHING_NOTIFIER
     
     return DeleteNodeNotifier(self, self.node_to_qt_index(node_to_delete))
   
@@ -124,7 +124,7 @@ class SequenceComponentTreeQtModel(QAbstractItemModel):
     # No special operations are required if the sequence component tree being modified is not the one this Qt model is
     # showing.
     if self._project_tree_controller.active_node is not node_to_rename.tree_owner:
-      return DoNothingNotifier()
+      return DO_NOTHING_NOTIFIER
     
     # Determine what the node's child index will be after the rename.
     child_idx_after_rename = 0
@@ -151,7 +151,7 @@ class SequenceComponentTreeQtModel(QAbstractItemModel):
     # No special operations are required if the sequence component tree being modified is not the one this Qt model is
     # showing.
     if self._project_tree_controller.active_node is not node_to_reparent.tree_owner:
-      return DoNothingNotifier()
+      return DO_NOTHING_NOTIFIER
     
     # Determine what the node's child index will be after the operation.
     child_idx_after_reparent = new_parent.child_idx_from_name(node_to_reparent.name)
@@ -253,8 +253,10 @@ class SequenceComponentTreeQtModel(QAbstractItemModel):
         
         # Rename the node.
         try:
-          self._undo_stack.push(RenameSequenceComponentTreeNodeCommand(self._seq_component_tree_controller, node,
-            value))
+          command = RenameSequenceComponentTreeNodeCommand.try_create(self._seq_component_tree_controller, node,
+            value)
+          if command is not None:
+            self._undo_stack.push(command)
           return True
         
         # Renaming may fail due to the name being invalid or unavailable.
@@ -351,8 +353,10 @@ class SequenceComponentTreeQtModel(QAbstractItemModel):
         
         node = self._project_tree_controller.active_node.root_seq_component_node.resolve_path(seq_component_tree_path)
         new_parent_node = self.qt_index_to_node(parent)
-        self._undo_stack.push(ReparentSequenceComponentTreeNodeCommand(self._seq_component_tree_controller, node,
-          new_parent_node))
+        command = ReparentSequenceComponentTreeNodeCommand.try_create(self._seq_component_tree_controller, node,
+          new_parent_node)
+        if command is not None:
+          self._undo_stack.push(command)
         return True
       
       except ValueError:
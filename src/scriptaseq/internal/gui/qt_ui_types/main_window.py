@@ -20,18 +20,24 @@ from scriptaseq.internal.seq_component_tree.component_types import NoteSequenceC
   AutomationSequenceComponentType, WaveTableSequenceComponentType
 
 
+# Default maximum number of commands to keep on the undo stack. Zero means no limit.
+DEFAULT_UNDO_LIMIT = 200
+
 class MainWindow(QMainWindow, Ui_MainWindow):
   """Main window for a sequencing project"""
   
-  def __init__(self, parent=None):
+  def __init__(self, parent=None, undo_limit=DEFAULT_UNDO_LIMIT):
     """Constructor.
     parent -- Parent QObject.
+    undo_limit -- Maximum number of commands to keep on the undo stack. When the limit is reached, the oldest commands
+      are discarded. Zero means no limit.
     """
     QMainWindow.__init__(self, parent)
     self.setupUi(self)
     
     # Set up menu actions and undo stack.
     self._undo_stack = QUndoStack(self)
+    self._undo_stack.setUndoLimit(undo_limit)
     self.actionUndo.triggered.connect(self._undo_stack.createUndoAction(self).trigger)
     self.actionRedo.triggered.connect(self._undo_stack.createRedoAction(self).trigger)
     
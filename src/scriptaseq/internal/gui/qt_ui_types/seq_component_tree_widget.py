@@ -30,9 +30,19 @@ class SequenceComponentTreeWidget(QWidget, Ui_SequenceComponentTreeWidget):
     
     self.seqComponentTreeView.setModel(seq_component_tree_qt_model)
     
-    seq_component_tree_qt_model.modelReset.connect(lambda: self._current_selected_node_changed(QModelIndex()))
-    self.seqComponentTreeView.selectionModel().currentChanged.connect(
-      lambda new_qt_index, _: self._current_selected_node_changed(new_qt_index))
+    seq_component_tree_qt_model.modelReset.connect(self._qt_model_reset)
+    self.seqComponentTreeView.selectionModel().currentChanged.connect(self._current_qt_index_changed)
+  
+  def _qt_model_reset(self):
+    """Called after the sequence component tree Qt model has been reset."""
+    self._current_selected_node_changed(QModelIndex())
+  
+  def _current_qt_index_changed(self, new_qt_index, old_qt_index):
+    """Called when the current index in the sequence component tree view's selection model changes.
+    new_qt_index -- Qt index of the new current item.
+    old_qt_index -- Qt index of the previous current item.
+    """
+    self._current_selected_node_changed(new_qt_index)
   
   def _current_selected_node_changed(self, new_qt_index):
     """Should be called after the current selected node in the sequence component tree view has changed.
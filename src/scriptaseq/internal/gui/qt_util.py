@@ -1,13 +1,40 @@
 """Utilities related to PyQt functionality."""
+from functools import lru_cache
+
 from PyQt5.Qt import QFile, QCoreApplication, QDir, QIcon, QPixmap
 
 
+# Prefix that identifies paths referencing resources inside packaged Qt resource files.
+_PACKAGED_RESOURCE_PATH_PREFIX = ':'
+
+# Maximum number of packaged Qt resource reads to keep cached by read_qt_resource.
+_PACKAGED_RESOURCE_CACHE_SIZE = 128
+
 def read_qt_resource(path, encoding=None):
   """Reads a resource from the file system or a packaged Qt resource file.
-  Returns either binary or text data, depending on whether encoding is None.
+  Returns either binary or text data, depending on whether encoding is None. Reads of packaged Qt resources are
+  memoized, since those cannot change while the application is running. Reads from the file system are not.
   path -- Path to the resource. Should start with ":" if referencing a resource inside a packaged Qt resource file.
   encoding -- Text encoding to use for decoding the data, or None to return binary data.
   """
+  if path.startswith(_PACKAGED_RESOURCE_PATH_PREFIX):
+    return _read_packaged_qt_resource(path, encoding)
+  else:
+    return _read_qt_file(path, encoding)
+
+@lru_cache(maxsize=_PACKAGED_RESOURCE_CACHE_SIZE)
+def _read_packaged_qt_resource(path, encoding):
+  """Memoized version of _read_qt_file, for use with paths inside packaged Qt resource files.
+  path -- Path to the resource.
+  encoding -- Text encoding to use for decoding the data, or None to return binary data.
+  """
+  return _read_qt_file(path, encoding)
+
+def _read_qt_file(path, encoding):
+  """Reads a file through QFile, without any caching.
+  path -- Path to the file.
+  encoding -- Text encoding to use for decoding the data, or None to return binary data.
+  """
   qfile = QFile(path)
   try:
     # Open the QFile.
@@ -16,29 +43,63 @@ def read_qt_resource(path, encoding=None):
     
     # Read the data.
     # TODO: Handle reading in a way that can report errors.
-    data = bytes(qfile.readAll())
+    data = qfile.readAll()
     
+    # QByteArray supports the buffer protocol, so text can be decoded from it directly without first copying it into a
+    # bytes object.
     if encoding is None:
-      return data
+      return bytes(data)
     else:
-      return data.decode(encoding)
+      return str(data, encoding)
   
   # Close the QFile.
   finally:
     if qfile.isOpen():
       qfile.close()
 
+@lru_cache(maxsize=None)
 def make_multires_icon(path):
   """Makes a multi-resolution QIcon using images from the specified path.
   This function assumes that all files in the specified directory contain images that should be loaded into the QIcon.
+  Results are memoized by path, so repeated calls for the same path return the same QIcon. The caller should avoid
+  modifying the returned QIcon.
   path -- Path to the directory containing the images from which the icon should be constructed. Should start with ":"
     if referencing a resource inside a packaged Qt resource file.
   """
   icon = QIcon()
   
   # For each file found in the specified directory, add a pixmap of the file's contents to the icon.
-  for file_info in QDir(path).entryInfoList(sort=QDir.Name):
-    if file_info.isFile():
-      icon.addPixmap(QPixmap(file_info.absoluteFilePath()))
+  icon_dir = QDir(path)
+  for file_name in icon_dir.entryList(QDir.Files, QDir.Name):
+    icon.addPixmap(QPixmap(icon_dir.absoluteFilePath(file_name)))
+  
+  return icon
+
+@lru_cache(maxsize=None)
+def make_blank_icon():
+  """Gets an empty QIcon.
+  The same QIcon is returned on every call, so the caller should avoid modifying it.
+  """
+  return QIcon()
+
+class CachedTranslator:
+  """Provides memoized access to QCoreApplication.translate.
+  Each distinct combination of arguments is translated only once, and the result is reused afterward. The cache does
+  not notice changes to the application's installed translators, so clear_cache should be called after installing or
+  removing a translator.
+  """
+  
+  @staticmethod
+  @lru_cache(maxsize=None)
+  def translate(context, source_text, disambiguation=None):
+    """Translates a string in the same way as QCoreApplication.translate, reusing previously translated results.
+    context -- Translation context.
+    source_text -- Text to translate.
+    disambiguation -- Disambiguating comment for the text, or None.
+    """
+    return QCoreApplication.translate(context, source_text, disambiguation)
   
-  return icon
\ No newline at end of file
+  @staticmethod
+  def clear_cache():
+    """Discards all previously translated results."""
+    CachedTranslator.translate.cache_clear()
@@ -1,22 +1,50 @@
 """Functionality for generating IDs for undo command classes."""
+import itertools
+
 from PyQt5.Qt import QUndoCommand
 
 
-_next_id = 1
+# Counter that yields the undo command class IDs, starting from 1.
+_id_counter = itertools.count(1)
+
 def gen_undo_id():
   """Generates an undo command class ID."""
-  global _next_id
-  result = _next_id
-  _next_id += 1
-  return result
+  return next(_id_counter)
 
 class UndoCommandWithClassBasedID(QUndoCommand):
   """Base class for QUndoCommands with IDs based on their classes.
   Subclasses should define a class-level attribute called undo_id indicating the ID number to use for instances of that
-  class.
+  class. Subclasses that don't define their own undo_id inherit -1, which tells Qt never to try merging their instances.
   """
   
-  undo_id = gen_undo_id()
+  undo_id = -1
+  
+  def __init_subclass__(cls, **kwargs):
+    super().__init_subclass__(**kwargs)
+    
+    # Bind the class's ID directly into its id method. Qt calls id() on every push, so this avoids the attribute
+    # lookups through the instance's class. Classes without their own ID keep Qt's default id, which returns -1.
+    undo_id = cls.undo_id
+    if undo_id != -1:
+      cls.id = lambda self: undo_id
+  
+  @classmethod
+  def _is_no_op(cls, *args, **kwargs):
+    """Checks whether a command of this class constructed with the specified arguments would have no effect.
+    Default implementation returns False. Subclasses whose commands can be no-ops should override this.
+    args -- Positional arguments for the constructor.
+    kwargs -- Keyword arguments for the constructor.
+    """
+    return False
   
-  def id(self):
-    return self.__class__.undo_id
\ No newline at end of file
+  @classmethod
+  def try_create(cls, *args, **kwargs):
+    """Creates a command of this class, or returns None if the command would have no effect.
+    The check is done by _is_no_op before constructing anything. Any exceptions raised by the constructor are passed
+    through to the caller.
+    args -- Positional arguments for the constructor.
+    kwargs -- Keyword arguments for the constructor.
+    """
+    if cls._is_no_op(*args, **kwargs):
+      return None
+    return cls(*args, **kwargs)
\ No newline at end of file
@@ -1,6 +1,7 @@
 """Contains QUndoCommand subclasses related to high-level operations on the project tree."""
 
-from scriptaseq.internal.gui.undo_commands.id_gen import gen_undo_id, UndoCommandWithClassBasedID
+from scriptaseq.internal.gui.qt_util import CachedTranslator
+from scriptaseq.internal.gui.undo_commands.id_gen import UndoCommandWithClassBasedID
 from scriptaseq.named_tree_node import NamedTreeNode
 from PyQt5.Qt import QCoreApplication
 
@@ -8,8 +9,6 @@ from PyQt5.Qt import QCoreApplication
 class BaseProjectTreeUndoCommand(UndoCommandWithClassBasedID):
   """Base class for QUndoCommands related to high-level operations on the project tree."""
   
-  undo_id = gen_undo_id()
-  
   def __init__(self, project_tree_controller, parent=None):
     """Constructor.
     project_tree_controller -- Reference to the ProjectTreeController in charge of making high-level changes to the
@@ -22,8 +21,6 @@ class BaseProjectTreeUndoCommand(UndoCommandWithClassBasedID):
 class AddProjectTreeNodeCommand(BaseProjectTreeUndoCommand):
   """QUndoCommand class for adding a new node to the project tree."""
   
-  undo_id = gen_undo_id()
-  
   def __init__(self, project_tree_controller, node, parent_node, parent=None):
     """Constructor.
     Raises ValueError if it is determined that the addition operation would fail.
@@ -42,7 +39,7 @@ class AddProjectTreeNodeCommand(BaseProjectTreeUndoCommand):
     self._new_node = node
     self._parent_node = parent_node
     
-    self.setText(QCoreApplication.translate('AddProjectTreeNodeCommand', "Create '{}'").format(node.name))
+    self.setText(CachedTranslator.translate('AddProjectTreeNodeCommand', "Create '{}'").format(node.name))
   
   def redo(self):
     self.project_tree_controller.add_node(self._new_node, self._parent_node)
@@ -53,8 +50,6 @@ class AddProjectTreeNodeCommand(BaseProjectTreeUndoCommand):
 class DeleteProjectTreeNodeCommand(BaseProjectTreeUndoCommand):
   """QUndoCommand class for deleting a node from the project tree."""
   
-  undo_id = gen_undo_id()
-  
   def __init__(self, project_tree_controller, node, parent=None):
     """Constructor.
     Raises ValueError if it is determined that the deletion operation would fail.
@@ -72,7 +67,7 @@ class DeleteProjectTreeNodeCommand(BaseProjectTreeUndoCommand):
     self._node = node
     self._parent_node = node.parent
     
-    self.setText(QCoreApplication.translate('DeleteProjectTreeNodeCommand', "Delete '{}'").format(node.name))
+    self.setText(CachedTranslator.translate('DeleteProjectTreeNodeCommand', "Delete '{}'").format(node.name))
   
   def redo(self):
     self.project_tree_controller.delete_node(self._node)
@@ -83,7 +78,9 @@ class DeleteProjectTreeNodeCommand(BaseProjectTreeUndoCommand):
 class RenameProjectTreeNodeCommand(BaseProjectTreeUndoCommand):
   """QUndoCommand class for renaming a node in the project tree."""
   
-  undo_id = gen_undo_id()
+  @classmethod
+  def _is_no_op(cls, project_tree_controller, node, new_name, parent=None):
+    return node.name == new_name
   
   def __init__(self, project_tree_controller, node, new_name, parent=None):
     """Constructor.
@@ -106,21 +103,25 @@ class RenameProjectTreeNodeCommand(BaseProjectTreeUndoCommand):
     self._old_name = node.name
     self._new_name = new_name
     
-    self.setText(
-      QCoreApplication.translate('RenameProjectTreeNodeUndoCommand', "Rename '{}' to '{}'").format(self._old_name, new_name))
-    self.setObsolete(self._old_name == self._new_name)
+    # Commands that are obsolete from the start get dropped by the undo stack without ever being displayed, so
+    # skip building their text.
+    self.setObsolete(self._is_no_op(project_tree_controller, node, new_name))
+    if not self.isObsolete():
+      self.setText(
+        CachedTranslator.translate('RenameProjectTreeNodeUndoCommand', "Rename '{}' to '{}'").format(self._old_name, self._new_name))
   
   def redo(self):
     self.project_tree_controller.rename_node(self._node, self._new_name)
   
-  
   def undo(self):
     self.project_tree_controller.rename_node(self._node, self._old_name)
 
 class ReparentProjectTreeNodeCommand(BaseProjectTreeUndoCommand):
   """QUndoCommand class for reparenting a node in the project tree."""
   
-  undo_id = gen_undo_id()
+  @classmethod
+  def _is_no_op(cls, project_tree_controller, node, new_parent, parent=None):
+    return node.parent is new_parent
   
   def __init__(self, project_tree_controller, node, new_parent, parent=None):
     """Constructor.
@@ -146,9 +147,12 @@ class ReparentProjectTreeNodeCommand(BaseProjectTreeUndoCommand):
     self._old_parent = node.parent
     self._new_parent = new_parent
     
-    self.setText(
-      QCoreApplication.translate('ReparentProjectTreeNodeCommand', "Move '{}' to Parent '{}'").format(self._node.name, self._new_parent.name))
-    self.setObsolete(self._old_parent is self._new_parent)
+    # Commands that are obsolete from the start get dropped by the undo stack without ever being displayed, so
+    # skip building their text.
+    self.setObsolete(self._is_no_op(project_tree_controller, node, new_parent))
+    if not self.isObsolete():
+      self.setText(
+        CachedTranslator.translate('ReparentProjectTreeNodeCommand', "Move '{}' to Parent '{}'").format(node.name, new_parent.name))
   
   def redo(self):
     self.project_tree_controller.reparent_node(self._node, self._new_parent)
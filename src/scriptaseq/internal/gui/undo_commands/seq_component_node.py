@@ -1,14 +1,12 @@
 """Contains QUndoCommand subclasses related to operations on individual nodes in a sequence component tree."""
 
-from scriptaseq.internal.gui.undo_commands.id_gen import gen_undo_id, UndoCommandWithClassBasedID
-from PyQt5.Qt import QCoreApplication
+from scriptaseq.internal.gui.qt_util import CachedTranslator
+from scriptaseq.internal.gui.undo_commands.id_gen import UndoCommandWithClassBasedID
 
 
 class BaseSequenceComponentNodeUndoCommand(UndoCommandWithClassBasedID):
   """Base class for QUndoCommands related to operations on individual nodes in a sequence component tree."""
   
-  undo_id = gen_undo_id()
-  
   def __init__(self, seq_component_node_controller, parent=None):
     """Constructor.
     seq_component_node_controller -- Reference to the SequenceComponentNodeController in charge of making changes to
@@ -21,7 +19,9 @@ class BaseSequenceComponentNodeUndoCommand(UndoCommandWithClassBasedID):
 class SetComponentTypeCommand(BaseSequenceComponentNodeUndoCommand):
   """QUndoCommand class for changing the component type of a sequence component tree node."""
   
-  undo_id = gen_undo_id()
+  @classmethod
+  def _is_no_op(cls, seq_component_node_controller, node, new_component_type, parent=None):
+    return node.component_type is new_component_type
   
   def __init__(self, seq_component_node_controller, node, new_component_type, parent=None):
     """Constructor.
@@ -37,9 +37,12 @@ class SetComponentTypeCommand(BaseSequenceComponentNodeUndoCommand):
     self._old_component_type = node.component_type
     self._new_component_type = new_component_type
     
-    self.setObsolete(self._old_component_type == self._new_component_type)
-    self.setText(
-      QCoreApplication.translate('SetComponentTypeCommand', "Change Type of '{}' to {}").format(node.name, new_component_type.display_name))
+    # Commands that are obsolete from the start get dropped by the undo stack without ever being displayed, so
+    # skip building their text.
+    self.setObsolete(self._is_no_op(seq_component_node_controller, node, new_component_type))
+    if not self.isObsolete():
+      self.setText(
+        CachedTranslator.translate('SetComponentTypeCommand', "Change Type of '{}' to {}").format(node.name, new_component_type.display_name))
   
   def redo(self):
     self.seq_component_node_controller.set_component_type(self._node, self._new_component_type)
@@ -1,6 +1,7 @@
 """Contains QUndoCommand subclasses related to high-level operations on the sequence component tree."""
 
-from scriptaseq.internal.gui.undo_commands.id_gen import gen_undo_id, UndoCommandWithClassBasedID
+from scriptaseq.internal.gui.qt_util import CachedTranslator
+from scriptaseq.internal.gui.undo_commands.id_gen import UndoCommandWithClassBasedID
 from scriptaseq.named_tree_node import NamedTreeNode
 from PyQt5.Qt import QCoreApplication
 
@@ -8,8 +9,6 @@ from PyQt5.Qt import QCoreApplication
 class BaseSequenceComponentTreeUndoCommand(UndoCommandWithClassBasedID):
   """Base class for QUndoCommands related to high-level operations on the sequence component tree."""
   
-  undo_id = gen_undo_id()
-  
   def __init__(self, seq_component_tree_controller, parent=None):
     """Constructor.
     seq_component_tree_controller -- Reference to the SequenceComponentTreeController in charge of making high-level
@@ -22,8 +21,6 @@ class BaseSequenceComponentTreeUndoCommand(UndoCommandWithClassBasedID):
 class AddSequenceComponentTreeNodeCommand(BaseSequenceComponentTreeUndoCommand):
   """QUndoCommand class for adding a new node to a sequence component tree."""
   
-  undo_id = gen_undo_id()
-  
   def __init__(self, seq_component_tree_controller, node, parent_node, parent=None):
     """Constructor.
     Raises ValueError if it is determined that the addition operation would fail.
@@ -43,7 +40,7 @@ class AddSequenceComponentTreeNodeCommand(BaseSequenceComponentTreeUndoCommand):
     self._new_node = node
     self._parent_node = parent_node
     
-    self.setText(QCoreApplication.translate('AddSequenceComponentTreeNodeCommand', "Create '{}'").format(node.name))
+    self.setText(CachedTranslator.translate('AddSequenceComponentTreeNodeCommand', "Create '{}'").format(node.name))
   
   def redo(self):
     self.seq_component_tree_controller.add_node(self._new_node, self._parent_node)
@@ -54,8 +51,6 @@ class AddSequenceComponentTreeNodeCommand(BaseSequenceComponentTreeUndoCommand):
 class DeleteSequenceComponentTreeNodeCommand(BaseSequenceComponentTreeUndoCommand):
   """QUndoCommand class for deleting a node from a sequence component tree."""
   
-  undo_id = gen_undo_id()
-  
   def __init__(self, seq_component_tree_controller, node, parent=None):
     """Constructor.
     Raises ValueError if it is determined that the deletion operation would fail.
@@ -73,7 +68,7 @@ class DeleteSequenceComponentTreeNodeCommand(BaseSequenceComponentTreeUndoComman
     self._node = node
     self._parent_node = node.parent
     
-    self.setText(QCoreApplication.translate('DeleteSequenceComponentTreeNodeCommand', "Delete '{}'").format(node.name))
+    self.setText(CachedTranslator.translate('DeleteSequenceComponentTreeNodeCommand', "Delete '{}'").format(node.name))
   
   def redo(self):
     self.seq_component_tree_controller.delete_node(self._node)
@@ -84,7 +79,9 @@ class DeleteSequenceComponentTreeNodeCommand(BaseSequenceComponentTreeUndoComman
 class RenameSequenceComponentTreeNodeCommand(BaseSequenceComponentTreeUndoCommand):
   """QUndoCommand class for renaming a node in a sequence component tree."""
   
-  undo_id = gen_undo_id()
+  @classmethod
+  def _is_no_op(cls, seq_component_tree_controller, node, new_name, parent=None):
+    return node.name == new_name
   
   def __init__(self, seq_component_tree_controller, node, new_name, parent=None):
     """Constructor.
@@ -107,21 +104,25 @@ class RenameSequenceComponentTreeNodeCommand(BaseSequenceComponentTreeUndoComman
     self._old_name = node.name
     self._new_name = new_name
     
-    self.setText(
-      QCoreApplication.translate('RenameSequenceComponentTreeNodeCommand', "Rename '{}' to '{}'").format(self._old_name, new_name))
-    self.setObsolete(self._old_name == self._new_name)
+    # Commands that are obsolete from the start get dropped by the undo stack without ever being displayed, so
+    # skip building their text.
+    self.setObsolete(self._is_no_op(seq_component_tree_controller, node, new_name))
+    if not self.isObsolete():
+      self.setText(
+        CachedTranslator.translate('RenameSequenceComponentTreeNodeCommand', "Rename '{}' to '{}'").format(self._old_name, self._new_name))
   
   def redo(self):
     self.seq_component_tree_controller.rename_node(self._node, self._new_name)
   
-  
   def undo(self):
     self.seq_component_tree_controller.rename_node(self._node, self._old_name)
 
 class ReparentSequenceComponentTreeNodeCommand(BaseSequenceComponentTreeUndoCommand):
   """QUndoCommand class for reparenting a node in a sequence component tree."""
   
-  undo_id = gen_undo_id()
+  @classmethod
+  def _is_no_op(cls, seq_component_tree_controller, node, new_parent, parent=None):
+    return node.parent is new_parent
   
   def __init__(self, seq_component_tree_controller, node, new_parent, parent=None):
     """Constructor.
@@ -147,9 +148,12 @@ class ReparentSequenceComponentTreeNodeCommand(BaseSequenceComponentTreeUndoComm
     self._old_parent = node.parent
     self._new_parent = new_parent
     
-    self.setText(
-      QCoreApplication.translate('ReparentSequenceComponentTreeNodeCommand', "Move '{}' to Parent '{}'").format(self._node.name, self._new_parent.name))
-    self.setObsolete(self._old_parent is self._new_parent)
+    # Commands that are obsolete from the start get dropped by the undo stack without ever being displayed, so
+    # skip building their text.
+    self.setObsolete(self._is_no_op(seq_component_tree_controller, node, new_parent))
+    if not self.isObsolete():
+      self.setText(
+        CachedTranslator.translate('ReparentSequenceComponentTreeNodeCommand', "Move '{}' to Parent '{}'").format(node.name, new_parent.name))
   
   def redo(self):
     self.seq_component_tree_controller.reparent_node(self._node, self._new_parent)
@@ -1,20 +1,39 @@
 """Functionality related to use of media/MIME types to transfer data around within the application.
 This functionality may be used e.g. by a drag and drop mechanism.
 """
+from functools import lru_cache
+import sys
+
 from PyQt5.Qt import QCoreApplication
 
 from scriptaseq.named_tree_node import TreeNamePath
-import pickle
 
 
 # String encoding to use when serializing strings.
-MEDIA_STR_ENCODING = 'utf-8'
+MEDIA_STR_ENCODING = sys.intern('utf-8')
 
 # Media type for path-based references to project tree nodes.
-PROJECT_TREE_NODE_PATH_MEDIA_TYPE = 'application/x-scriptaseq-project-tree-node-path'
+PROJECT_TREE_NODE_PATH_MEDIA_TYPE = sys.intern('application/x-scriptaseq-project-tree-node-path')
 
 # Media type for path-based references to sequence component tree nodes.
-SEQUENCE_COMPONENT_TREE_NODE_PATH_MEDIA_TYPE = 'application/x-scriptaseq-seq-component-tree-node-path'
+SEQUENCE_COMPONENT_TREE_NODE_PATH_MEDIA_TYPE = sys.intern('application/x-scriptaseq-seq-component-tree-node-path')
+
+# Number of bytes used for the length prefix that separates the two paths in sequence component tree node path data.
+_PATH_LENGTH_PREFIX_SIZE = 4
+
+# Byte order of the length prefix in sequence component tree node path data.
+_PATH_LENGTH_PREFIX_BYTE_ORDER = 'little'
+
+# Maximum number of encoded paths to keep cached.
+_ENCODED_PATH_CACHE_SIZE = 256
+
+@lru_cache(maxsize=_ENCODED_PATH_CACHE_SIZE)
+def _encode_path(path):
+  """Converts a TreeNamePath to a string and encodes it using MEDIA_STR_ENCODING.
+  Results are cached, since the same paths tend to get encoded repeatedly, e.g. during a drag.
+  path -- TreeNamePath to encode.
+  """
+  return str(path).encode(MEDIA_STR_ENCODING)
 
 def encode_project_tree_node_path(path):
   """Encodes a path-based reference to a project tree node.
@@ -26,14 +45,15 @@ def encode_project_tree_node_path(path):
     raise ValueError(
       QCoreApplication.translate('MIMEData', 'Cannot encode relative path as project tree node path data.'))
   
-  return str(path).encode(MEDIA_STR_ENCODING)
+  return _encode_path(path)
 
 def decode_project_tree_node_path(data):
   """Decodes a path-based reference to a project tree node.
   Suitable for use with the PROJECT_TREE_NODE_PATH_MEDIA_TYPE media type.
   Returns the decoded path as a TreeNamePath object.
   """
-  path = TreeNamePath.from_str(bytes(data).decode(MEDIA_STR_ENCODING))
+  # Decode straight from the buffer, without first copying the data into a bytes object.
+  path = TreeNamePath.from_str(str(data, MEDIA_STR_ENCODING))
   if not path.is_absolute:
     raise ValueError(QCoreApplication.translate('MIMEData', 'Expected an absolute path, got a relative path.'))
   return path
@@ -54,19 +74,34 @@ def encode_seq_component_tree_node_path(project_tree_path, seq_component_tree_pa
     raise ValueError(
       QCoreApplication.translate('MIMEData', 'Cannot encode relative path as sequence component tree node path data.'))
   
-  project_tree_path_bytes = str(project_tree_path).encode(MEDIA_STR_ENCODING)
-  seq_component_tree_path_bytes = str(seq_component_tree_path).encode(MEDIA_STR_ENCODING)
-  return pickle.dumps((project_tree_path_bytes, seq_component_tree_path_bytes))
+  project_tree_path_bytes = _encode_path(project_tree_path)
+  seq_component_tree_path_bytes = _encode_path(seq_component_tree_path)
+  
+  # Prefix the data with the length of the project tree path, so that the two paths can be separated when decoding.
+  path_length_prefix = len(project_tree_path_bytes).to_bytes(_PATH_LENGTH_PREFIX_SIZE, _PATH_LENGTH_PREFIX_BYTE_ORDER)
+  return path_length_prefix + project_tree_path_bytes + seq_component_tree_path_bytes
 
 def decode_seq_component_tree_node_path(data):
   """Decodes a path-based reference to a sequence component tree node.
   Suitable for use with the SEQUENCE_COMPONENT_TREE_NODE_PATH_MEDIA_TYPE media type.
   Returns the decoded paths as a 2-tuple containing the project tree node's absolute path and the sequence component
   node's absolute path.
+  Raises ValueError if the data is malformed.
   """
-  project_tree_path_bytes, seq_component_tree_path_bytes = pickle.loads(bytes(data))
-  project_tree_path = TreeNamePath.from_str(project_tree_path_bytes.decode(MEDIA_STR_ENCODING))
-  seq_component_tree_path = TreeNamePath.from_str(seq_component_tree_path_bytes.decode(MEDIA_STR_ENCODING))
+  # Slice through a memoryview, so that the paths are decoded straight from the buffer without copying the data.
+  data = memoryview(data)
+  
+  # Use the length prefix to find where the project tree path ends.
+  if len(data) < _PATH_LENGTH_PREFIX_SIZE:
+    raise ValueError(QCoreApplication.translate('MIMEData', 'Sequence component tree node path data is too short.'))
+  project_tree_path_end = _PATH_LENGTH_PREFIX_SIZE + int.from_bytes(data[:_PATH_LENGTH_PREFIX_SIZE],
+    _PATH_LENGTH_PREFIX_BYTE_ORDER)
+  if project_tree_path_end > len(data):
+    raise ValueError(QCoreApplication.translate('MIMEData', 'Sequence component tree node path data is truncated.'))
+  
+  project_tree_path = TreeNamePath.from_str(
+    str(data[_PATH_LENGTH_PREFIX_SIZE:project_tree_path_end], MEDIA_STR_ENCODING))
+  seq_component_tree_path = TreeNamePath.from_str(str(data[project_tree_path_end:], MEDIA_STR_ENCODING))
   
   if not project_tree_path.is_absolute:
     raise ValueError(QCoreApplication.translate('MIMEData', 'Expected an absolute path, got a relative path.'))
@@ -1,47 +1,16 @@
 """Defines a controller class for making high-level changes to the project tree."""
-from PyQt5.Qt import QObject, pyqtSignal, QCoreApplication
+from PyQt5.Qt import QCoreApplication
 
-from scriptaseq.internal.project_tree.project_tree_nodes import BaseProjectTreeNode
-from scriptaseq.named_tree_node import NamedTreeNode
+from scriptaseq.internal.project_change_controllers.tree_controller import BaseTreeController
 
 
-class ProjectTreeController(QObject):
+class ProjectTreeController(BaseTreeController):
   """Controller class for making high-level changes to a project tree.
   Supported changes include adding, deleting, and renaming project tree nodes.
   Note that this class does not internally support undo/redo functionality, so its methods that change project state
   should generally be called only from within subclasses of QUndoCommand.
   """
   
-  # Signal emitted when the active node in the project tree has changed.
-  # Arguments:
-  # - Reference to the new active project tree node, or None if there is no active project tree node.
-  active_node_changed = pyqtSignal(object)
-  
-  # Signal emitted when a node has been added.
-  # Arguments:
-  # - Reference to the node that was added.
-  node_added = pyqtSignal(BaseProjectTreeNode)
-  
-  # Signal emitted when a node has been deleted.
-  # Arguments:
-  # - Reference to the node that was deleted.
-  # - Reference to the former parent of the node that was deleted.
-  node_deleted = pyqtSignal(BaseProjectTreeNode, BaseProjectTreeNode)
-  
-  # Signal emitted when a node has been renamed.
-  # Arguments:
-  # - Reference to the node that was renamed.
-  # - String containing the new name.
-  # - String containing the old name.
-  node_renamed = pyqtSignal(BaseProjectTreeNode, str, str)
-  
-  # Signal emitted when a node has been reparented.
-  # Arguments:
-  # - Reference to the node that was reparented.
-  # - Reference to the new parent to which the node was added.
-  # - Reference to the old parent from which the node was removed.
-  node_reparented = pyqtSignal(BaseProjectTreeNode, BaseProjectTreeNode, BaseProjectTreeNode)
-  
   def __init__(self, root_node, parent=None):
     """Constructor.
     root_node -- Root node of the project tree.
@@ -50,7 +19,6 @@ class ProjectTreeController(QObject):
     super().__init__(parent)
     
     self._root_node = root_node
-    self._active_node = None
     
     self._project_tree_qt_model = None
     self._seq_component_tree_qt_model = None
@@ -82,108 +50,26 @@ class ProjectTreeController(QObject):
     self._seq_component_tree_qt_model = seq_component_tree_qt_model
   
   @property
-  def active_node(self):
-    """Property containing a reference to the active project tree node.
-    A value of None means there is no active project tree node.
-    """
-    return self._active_node
+  def _tree_qt_model(self):
+    return self.project_tree_qt_model
   
-  @active_node.setter
-  def active_node(self, active_node):
-    # Notify the SequenceComponentTreeQtModel before and after the change.
-    with self.seq_component_tree_qt_model.begin_change_active_project_tree_node():
-      self._active_node = active_node
-    
-    # Send out appropriate signals to notify other GUI components.
-    self.active_node_changed.emit(active_node)
+  def _begin_change_active_node(self):
+    return self.seq_component_tree_qt_model.begin_change_active_project_tree_node()
   
-  def add_node(self, node, parent):
-    """Adds a node to the project tree.
-    Raises ValueError if the operation cannot be performed.
-    node -- New project tree node to add.
-    parent -- Parent to which the new node will be added.
-    """
+  def _verify_can_add_node(self, node, parent):
     if node.parent is not None or node is self._root_node:
       raise ValueError(
         QCoreApplication.translate('ProjectTreeController', 'Cannot add a node that already exists in the project tree.'))
-    parent.verify_can_add_as_child(node)
-    
-    # Notify the ProjectTreeQtModel before and after making the change.
-    with self.project_tree_qt_model.begin_add_node(node, parent):
-      node.parent = parent
-    
-    # Send out appropriate signals to notify other GUI components.
-    self.node_added.emit(node)
+    super()._verify_can_add_node(node, parent)
   
-  def delete_node(self, node):
-    """Deletes a node from the project tree.
-    Raises ValueError if the operation cannot be performed.
-    node -- Project tree node to delete.
-    """
+  def _verify_can_delete_node(self, node):
     if node.parent is None:
       raise ValueError(
         QCoreApplication.translate('ProjectTreeController', 'Cannot delete root node from the project tree.'))
-    
-    # Reset the active node first, if it or one of its ancestors is being deleted.
-    if self.active_node is not None and (node is self.active_node or node in self.active_node.ancestors):
-      self.active_node = None
-    
-    parent_node = node.parent
-    
-    # Notify the ProjectTreeQtModel before and after making the change.
-    with self.project_tree_qt_model.begin_delete_node(node):
-      node.parent = None
-    
-    # Send out appropriate signals to notify other GUI components.
-    self.node_deleted.emit(node, parent_node)
   
-  def rename_node(self, node, new_name):
-    """Performs a rename operation on a node in the project tree.
-    Raises ValueError if the operation cannot be performed.
-    node -- Project tree node to rename.
-    new_name -- New name for the project tree node.
-    """
-    # Do nothing if the node already has the specified name.
-    if node.name == new_name:
-      return
-    
-    # Check that the name is valid and available before notifying the ProjectTreeQtModel.
-    if node.parent is not None:
-      node.parent.verify_child_name_available(new_name)
-    else:
-      NamedTreeNode.verify_name_valid(new_name)
-    
-    old_name = node.name
-    
-    # Notify the ProjectTreeQtModel before and after making the change.
-    with self.project_tree_qt_model.begin_rename_node(node, new_name):
-      node.name = new_name
-    
-    # Send out appropriate signals to notify other GUI components.
-    self.node_renamed.emit(node, new_name, old_name)
-  
-  def reparent_node(self, node, new_parent):
-    """Performs a reparent operation on a node in the project tree.
-    Raises ValueError if the operation cannot be performed.
-    node -- Project tree node to reparent.
-    new_parent -- New parent for the project tree node.
-    """
-    # Do nothing if the node already has the specified parent.
-    if node.parent is new_parent:
-      return
-    
-    # Check that the operation is valid before notifying the ProjectTreeQtModel.
+  def _verify_can_reparent_node(self, node, new_parent):
     if node.parent is None:
       raise ValueError(QCoreApplication.translate('ProjectTreeController', 'Cannot reparent root project tree node.'))
     if new_parent is None:
       raise ValueError(QCoreApplication.translate('ProjectTreeController', 'Cannot make a new root project tree node.'))
-    new_parent.verify_can_add_as_child(node)
-    
-    old_parent = node.parent
-    
-    # Notify the ProjectTreeQtModel before and after making the change.
-    with self.project_tree_qt_model.begin_reparent_node(node, new_parent):
-      node.parent = new_parent
-    
-    # Send out appropriate signals to notify other GUI components.
-    self.node_reparented.emit(node, new_parent, old_parent)
\ No newline at end of file
+    super()._verify_can_reparent_node(node, new_parent)
\ No newline at end of file
@@ -2,8 +2,6 @@
 
 from PyQt5.Qt import QObject, pyqtSignal
 
-from scriptaseq.internal.seq_component_tree.component_tree_nodes import BaseSequenceComponentNode
-
 
 class SequenceComponentNodeController(QObject):
   """Controller class for making changes to individual nodes in sequence component trees.
@@ -16,7 +14,7 @@ class SequenceComponentNodeController(QObject):
   # - Reference to the BaseSequenceComponentNode whose component type has been changed.
   # - BaseSequenceComponentType subclass representing the new component type.
   # - BaseSequenceComponentType subclass representing the old component type.
-  node_component_type_changed = pyqtSignal(BaseSequenceComponentNode, type, type)
+  node_component_type_changed = pyqtSignal(object, object, object)
   
   def set_component_type(self, node, new_component_type):
     """Sets the component type for a sequence component tree node.
@@ -24,7 +22,7 @@ class SequenceComponentNodeController(QObject):
     new_component_type -- New component type for the node.
     """
     # Do nothing if the node already has the specified component type.
-    if node.component_type == new_component_type:
+    if node.component_type is new_component_type:
       return
     
     old_component_type = node.component_type
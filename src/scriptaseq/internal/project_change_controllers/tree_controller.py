@@ -0,0 +1,215 @@
+"""Defines a base controller class for making high-level changes to trees of NamedTreeNodes."""
+
+from PyQt5.Qt import QObject, pyqtSignal
+
+from scriptaseq.internal.gui.qt_models.qt_model_notifiers import DO_NOTHING_NOTIFIER
+from scriptaseq.named_tree_node import NamedTreeNode
+
+
+class _NoTreeQtModel:
+  """Stand-in for a tree Qt model, for controllers that have no Qt model to notify of changes to the tree."""
+  
+  def begin_add_node(self, node, parent):
+    return DO_NOTHING_NOTIFIER
+  
+  def begin_delete_node(self, node):
+    return DO_NOTHING_NOTIFIER
+  
+  def begin_rename_node(self, node, new_name):
+    return DO_NOTHING_NOTIFIER
+  
+  def begin_reparent_node(self, node, new_parent):
+    return DO_NOTHING_NOTIFIER
+
+# Shared instance of _NoTreeQtModel. The class holds no state, so one instance is enough.
+_NO_TREE_QT_MODEL = _NoTreeQtModel()
+
+class BaseTreeController(QObject):
+  """Base controller class for making high-level changes to a tree of NamedTreeNodes.
+  Supported changes include adding, deleting, renaming, and reparenting nodes, as well as changing the active node.
+  Subclasses should override _tree_qt_model and _begin_change_active_node to notify their Qt models of changes, and
+  should override the _verify_can_* methods to check for conditions specific to their trees.
+  Note that this class does not internally support undo/redo functionality, so its methods that change project state
+  should generally be called only from within subclasses of QUndoCommand.
+  """
+  
+  # Signal emitted when the active node in the tree has changed.
+  # Arguments:
+  # - Reference to the new active node, or None if there is no active node.
+  active_node_changed = pyqtSignal(object)
+  
+  # Signal emitted when a node has been added.
+  # Arguments:
+  # - Reference to the node that was added.
+  node_added = pyqtSignal(object)
+  
+  # Signal emitted when a node has been deleted.
+  # Arguments:
+  # - Reference to the node that was deleted.
+  # - Reference to the former parent of the node that was deleted.
+  node_deleted = pyqtSignal(object, object)
+  
+  # Signal emitted when a node has been renamed.
+  # Arguments:
+  # - Reference to the node that was renamed.
+  # - String containing the new name.
+  # - String containing the old name.
+  node_renamed = pyqtSignal(object, str, str)
+  
+  # Signal emitted when a node has been reparented.
+  # Arguments:
+  # - Reference to the node that was reparented.
+  # - Reference to the new parent to which the node was added.
+  # - Reference to the old parent from which the node was removed.
+  node_reparented = pyqtSignal(object, object, object)
+  
+  def __init__(self, parent=None):
+    """Constructor.
+    parent -- Parent QObject.
+    """
+    super().__init__(parent)
+    
+    self._active_node = None
+  
+  @property
+  def _tree_qt_model(self):
+    """Read-only property containing the Qt model that must be notified before and after changes to the tree.
+    Default implementation returns a stand-in that ignores all notifications, for trees that are not shown in any Qt
+    model. Subclasses should override this.
+    """
+    return _NO_TREE_QT_MODEL
+  
+  def _begin_change_active_node(self):
+    """Notifies any Qt models that depend on the active node that the active node is about to change.
+    Returns a notifier object that can be used in a with statement, as with the begin_* methods on Qt models.
+    Default implementation returns a notifier that does nothing. Subclasses should override this.
+    """
+    return DO_NOTHING_NOTIFIER
+  
+  def _verify_can_add_node(self, node, parent):
+    """Checks that a node can be added to the tree, and raises ValueError if not.
+    Default implementation checks that the node can be added as a child of the parent. Subclasses that override this
+    should generally call the parent class implementation.
+    node -- New node to add.
+    parent -- Parent to which the new node would be added.
+    """
+    parent.verify_can_add_as_child(node)
+  
+  def _verify_can_delete_node(self, node):
+    """Checks that a node can be deleted from the tree, and raises ValueError if not.
+    Default implementation does nothing. Subclasses should override this to reject deletion of the root node.
+    node -- Node to delete.
+    """
+    pass
+  
+  def _verify_can_reparent_node(self, node, new_parent):
+    """Checks that a node can be moved to a new parent, and raises ValueError if not.
+    Default implementation checks that the node can be added as a child of the new parent. Subclasses that override
+    this should generally call the parent class implementation after rejecting root-related cases, since the default
+    implementation assumes new_parent is not None.
+    node -- Node to reparent.
+    new_parent -- New parent for the node.
+    """
+    new_parent.verify_can_add_as_child(node)
+  
+  @property
+  def active_node(self):
+    """Property containing a reference to the active node in the tree.
+    A value of None means there is no active node.
+    """
+    return self._active_node
+  
+  @active_node.setter
+  def active_node(self, active_node):
+    # Do nothing if the node is already active, so that dependent Qt models aren't reset for no reason.
+    if active_node is self._active_node:
+      return
+    
+    # Notify dependent Qt models before and after the change.
+    with self._begin_change_active_node():
+      self._active_node = active_node
+    
+    # Send out appropriate signals to notify other GUI components.
+    self.active_node_changed.emit(active_node)
+  
+  def add_node(self, node, parent):
+    """Adds a node to the tree.
+    Raises ValueError if the operation cannot be performed.
+    node -- New node to add.
+    parent -- Parent to which the new node will be added.
+    """
+    self._verify_can_add_node(node, parent)
+    
+    # Notify the Qt model before and after making the change.
+    with self._tree_qt_model.begin_add_node(node, parent):
+      node.parent = parent
+    
+    # Send out appropriate signals to notify other GUI components.
+    self.node_added.emit(node)
+  
+  def delete_node(self, node):
+    """Deletes a node from the tree.
+    Raises ValueError if the operation cannot be performed.
+    node -- Node to delete.
+    """
+    self._verify_can_delete_node(node)
+    
+    # Reset the active node first, if it or one of its ancestors is being deleted.
+    if self.active_node is not None and (node is self.active_node or self.active_node.is_descendant_of(node)):
+      self.active_node = None
+    
+    parent_node = node.parent
+    
+    # Notify the Qt model before and after making the change.
+    with self._tree_qt_model.begin_delete_node(node):
+      node.parent = None
+    
+    # Send out appropriate signals to notify other GUI components.
+    self.node_deleted.emit(node, parent_node)
+  
+  def rename_node(self, node, new_name):
+    """Performs a rename operation on a node in the tree.
+    Raises ValueError if the operation cannot be performed.
+    node -- Node to rename.
+    new_name -- New name for the node.
+    """
+    # Do nothing if the node already has the specified name.
+    if node.name == new_name:
+      return
+    
+    # Check that the name is valid and available before notifying the Qt model.
+    if node.parent is not None:
+      node.parent.verify_child_name_available(new_name)
+    else:
+      NamedTreeNode.verify_name_valid(new_name)
+    
+    old_name = node.name
+    
+    # Notify the Qt model before and after making the change.
+    with self._tree_qt_model.begin_rename_node(node, new_name):
+      node.name = new_name
+    
+    # Send out appropriate signals to notify other GUI components.
+    self.node_renamed.emit(node, new_name, old_name)
+  
+  def reparent_node(self, node, new_parent):
+    """Performs a reparent operation on a node in the tree.
+    Raises ValueError if the operation cannot be performed.
+    node -- Node to reparent.
+    new_parent -- New parent for the node.
+    """
+    # Do nothing if the node already has the specified parent.
+    if node.parent is new_parent:
+      return
+    
+    # Check that the operation is valid before notifying the Qt model.
+    self._verify_can_reparent_node(node, new_parent)
+    
+    old_parent = node.parent
+    
+    # Notify the Qt model before and after making the change.
+    with self._tree_qt_model.begin_reparent_node(node, new_parent):
+      node.parent = new_parent
+    
+    # Send out appropriate signals to notify other GUI components.
+    self.node_reparented.emit(node, new_parent, old_parent)
\ No newline at end of file
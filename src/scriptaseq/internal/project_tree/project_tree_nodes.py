@@ -1,8 +1,10 @@
 """Defines tree node types for the project tree."""
 
-from PyQt5.Qt import QIcon, QMenu, QCoreApplication
+from functools import partial
 
-from scriptaseq.internal.gui.qt_util import make_multires_icon
+from PyQt5.Qt import QMenu
+
+from scriptaseq.internal.gui.qt_util import make_multires_icon, make_blank_icon, CachedTranslator
 from scriptaseq.internal.gui.undo_commands.project_tree import DeleteProjectTreeNodeCommand, AddProjectTreeNodeCommand
 from scriptaseq.named_tree_node import NamedTreeNode
 from scriptaseq.internal.seq_component_tree.component_tree_nodes import NonInstancedSequenceComponentNode
@@ -16,10 +18,37 @@ _SEQUENCE_NODE_NAME_PREFIX = 'seq'
 # Name for the root node in a sequence component tree.
 _ROOT_SEQUENCE_COMPONENT_NODE_NAME = 'root'
 
+def _add_child_node(undo_stack, project_tree_controller, parent_node, node_class, name_prefix):
+  """Context menu handler that pushes a command to create a new child node.
+  undo_stack -- QUndoStack that should receive the command.
+  project_tree_controller -- ProjectTreeController in charge of high-level changes to the project tree.
+  parent_node -- BaseProjectTreeNode to which the new node will be added.
+  node_class -- BaseProjectTreeNode subclass to instantiate.
+  name_prefix -- Name prefix to use when choosing the new node's name.
+  """
+  new_node = node_class(parent_node.suggest_child_name(name_prefix))
+  undo_stack.push(AddProjectTreeNodeCommand(project_tree_controller, new_node, parent_node))
+
+def _delete_node(undo_stack, project_tree_controller, node):
+  """Context menu handler that pushes a command to delete a node.
+  undo_stack -- QUndoStack that should receive the command.
+  project_tree_controller -- ProjectTreeController in charge of high-level changes to the project tree.
+  node -- BaseProjectTreeNode to delete.
+  """
+  undo_stack.push(DeleteProjectTreeNodeCommand(project_tree_controller, node))
+
+def _make_active_node(project_tree_controller, node):
+  """Context menu handler that makes a node the active node in the project tree.
+  project_tree_controller -- ProjectTreeController in charge of high-level changes to the project tree.
+  node -- BaseProjectTreeNode to make active.
+  """
+  project_tree_controller.active_node = node
+
 class BaseProjectTreeNode(NamedTreeNode):
   """Base class for nodes in the project tree."""
   
-  # TODO: Add a memoization decorator to this method.
+  __slots__ = ()
+  
   @classmethod
   def get_icon(cls):
     """Gets a QIcon representing nodes of this class, creating it if it has not been previously created.
@@ -34,7 +63,7 @@ class BaseProjectTreeNode(NamedTreeNode):
     This method should not be called before the Qt application's resource loading configuration has been set up.
     Subclasses should override this. Default implementation returns an empty QIcon.
     """
-    return QIcon()
+    return make_blank_icon()
   
   def make_context_menu(self, undo_stack, project_tree_controller, parent=None):
     """Creates a context menu for this node.
@@ -46,32 +75,28 @@ class BaseProjectTreeNode(NamedTreeNode):
     
     # Add menu items for creating child nodes, if the node is allowed to have children.
     if self.can_have_children:
-      def add_dir_func():
-        new_node = DirProjectTreeNode(self.suggest_child_name(_DIR_NODE_NAME_PREFIX))
-        undo_stack.push(AddProjectTreeNodeCommand(project_tree_controller, new_node, self))
-      def add_sequence_func():
-        new_node = SequenceProjectTreeNode(self.suggest_child_name(_SEQUENCE_NODE_NAME_PREFIX))
-        undo_stack.push(AddProjectTreeNodeCommand(project_tree_controller, new_node, self))
-      add_menu = menu.addMenu(QCoreApplication.translate('BaseProjectTreeNode', '&Create Child'))
+      add_menu = menu.addMenu(CachedTranslator.translate('BaseProjectTreeNode', '&Create Child'))
       add_dir_action = add_menu.addAction(DirProjectTreeNode.get_icon(),
-        QCoreApplication.translate('BaseProjectTreeNode', '&Directory'))
+        CachedTranslator.translate('BaseProjectTreeNode', '&Directory'))
       add_sequence_action = add_menu.addAction(SequenceProjectTreeNode.get_icon(),
-        QCoreApplication.translate('BaseProjectTreeNode', '&Sequence'))
-      add_dir_action.triggered.connect(add_dir_func)
-      add_sequence_action.triggered.connect(add_sequence_func)
+        CachedTranslator.translate('BaseProjectTreeNode', '&Sequence'))
+      add_dir_action.triggered.connect(
+        partial(_add_child_node, undo_stack, project_tree_controller, self, DirProjectTreeNode, _DIR_NODE_NAME_PREFIX))
+      add_sequence_action.triggered.connect(partial(_add_child_node, undo_stack, project_tree_controller, self,
+        SequenceProjectTreeNode, _SEQUENCE_NODE_NAME_PREFIX))
     
     # Add a menu item for deleting the node, if it is not the root node.
     if self.parent is not None:
-      def delete_func():
-        undo_stack.push(DeleteProjectTreeNodeCommand(project_tree_controller, self))
-      delete_action = menu.addAction(QCoreApplication.translate('BaseProjectTreeNode', '&Delete'))
-      delete_action.triggered.connect(delete_func)
+      delete_action = menu.addAction(CachedTranslator.translate('BaseProjectTreeNode', '&Delete'))
+      delete_action.triggered.connect(partial(_delete_node, undo_stack, project_tree_controller, self))
     
     return menu
 
 class DirProjectTreeNode(BaseProjectTreeNode):
   """Class for project tree nodes that represent directories inside the project."""
   
+  __slots__ = ()
+  
   def __init__(self, name, parent=None):
     """Constructor.
     Raises ValueError if the name is invalid or the node cannot be added to the specified parent.
@@ -88,6 +113,8 @@ class DirProjectTreeNode(BaseProjectTreeNode):
 class SequenceProjectTreeNode(BaseProjectTreeNode):
   """Class for project tree nodes that represent Sequences."""
   
+  __slots__ = ('root_seq_component_node',)
+  
   def __init__(self, name, parent=None):
     """Constructor.
     Raises ValueError if the name is invalid or the node cannot be added to the specified parent.
@@ -108,10 +135,8 @@ class SequenceProjectTreeNode(BaseProjectTreeNode):
     menu = super().make_context_menu(undo_stack, project_tree_controller, parent)
     
     # Add a menu item for making the sequence the active node.
-    def make_active_func():
-      project_tree_controller.active_node = self
-    make_active_action = menu.addAction(QCoreApplication.translate('SequenceProjectTreeNode', 'Make &Active'))
-    make_active_action.triggered.connect(make_active_func)
+    make_active_action = menu.addAction(CachedTranslator.translate('SequenceProjectTreeNode', 'Make &Active'))
+    make_active_action.triggered.connect(partial(_make_active_node, project_tree_controller, self))
     
     return menu
     
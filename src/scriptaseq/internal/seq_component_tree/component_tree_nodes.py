@@ -1,9 +1,10 @@
 """Defines tree node types for a sequence component tree."""
 
+from functools import partial
+
 from PyQt5.Qt import QMenu, QCoreApplication
-from sortedcontainers.sorteddict import SortedDict
-from sortedcontainers.sortedset import SortedSet
 
+from scriptaseq.internal.gui.qt_util import CachedTranslator
 from scriptaseq.internal.gui.undo_commands.seq_component_node import SetComponentTypeCommand
 from scriptaseq.internal.gui.undo_commands.seq_component_tree import DeleteSequenceComponentTreeNodeCommand, \
   AddSequenceComponentTreeNodeCommand
@@ -12,9 +13,44 @@ from scriptaseq.internal.seq_component_tree.component_types import ContainerSequ
 from scriptaseq.named_tree_node import NamedTreeNode
 
 
+def _change_component_type(undo_stack, seq_component_node_controller, node, new_component_type):
+  """Context menu handler that pushes a command to change a node's component type.
+  undo_stack -- QUndoStack that should receive the command.
+  seq_component_node_controller -- SequenceComponentNodeController in charge of changes to individual nodes in the
+    sequence component tree.
+  node -- BaseSequenceComponentNode whose component type should be changed.
+  new_component_type -- BaseSequenceComponentType subclass representing the new component type.
+  """
+  command = SetComponentTypeCommand.try_create(seq_component_node_controller, node, new_component_type)
+  if command is not None:
+    undo_stack.push(command)
+
+def _add_child_component(undo_stack, seq_component_tree_controller, parent_node, component_type):
+  """Context menu handler that pushes a command to create a new child node.
+  undo_stack -- QUndoStack that should receive the command.
+  seq_component_tree_controller -- SequenceComponentTreeController in charge of high-level changes to the sequence
+    component tree.
+  parent_node -- BaseSequenceComponentNode to which the new node will be added.
+  component_type -- BaseSequenceComponentType subclass representing the new node's component type.
+  """
+  new_node = NonInstancedSequenceComponentNode(parent_node.suggest_child_name(component_type.node_default_name),
+    component_type=component_type, tree_owner=parent_node.tree_owner)
+  undo_stack.push(AddSequenceComponentTreeNodeCommand(seq_component_tree_controller, new_node, parent_node))
+
+def _delete_component(undo_stack, seq_component_tree_controller, node):
+  """Context menu handler that pushes a command to delete a node.
+  undo_stack -- QUndoStack that should receive the command.
+  seq_component_tree_controller -- SequenceComponentTreeController in charge of high-level changes to the sequence
+    component tree.
+  node -- BaseSequenceComponentNode to delete.
+  """
+  undo_stack.push(DeleteSequenceComponentTreeNodeCommand(seq_component_tree_controller, node))
+
 class CustomSequenceComponentPropValue:
   """Represents the value of a custom property attached to a sequence component tree node."""
   
+  __slots__ = ('value_str', 'is_expr')
+  
   def __init__(self, value_str, is_expr=False):
     """Constructor.
     value_str -- Property value, as a string.
@@ -27,6 +63,8 @@ class CustomSequenceComponentPropValue:
 class BaseSequenceComponentNode(NamedTreeNode):
   """Base class for nodes in a sequence component tree."""
   
+  __slots__ = ('tree_owner',)
+  
   def __init__(self, name, tree_owner):
     """Constructor.
     The constructed node initially has no parent.
@@ -57,7 +95,10 @@ class BaseSequenceComponentNode(NamedTreeNode):
   @property
   def is_instance_root(self):
     """Read-only boolean property indicating whether this node is the root of an instancing subtree."""
-    return self.is_in_instance() and (self.parent is None or not self.parent.is_in_instance())
+    if not self.is_in_instance:
+      return False
+    parent = self.parent
+    return parent is None or not parent.is_in_instance
   
   @property
   def instance_src(self):
@@ -69,12 +110,12 @@ class BaseSequenceComponentNode(NamedTreeNode):
   
   @property
   def custom_prop_names(self):
-    """Read-only property containing a SortedSet-like sequence of custom property names attached to this node.
-    Default implementation returns an empty SortedSet. Subclasses should override this.
+    """Read-only property containing a sorted sequence of custom property names attached to this node.
+    Default implementation returns an empty tuple. Subclasses should override this.
     The returned object may or may not automatically update when new custom properties are added. The caller should
     generally avoid modifying the returned object directly.
     """
-    return SortedSet()
+    return ()
   
   def get_custom_prop(self, name):
     """Gets the value of a custom property, as a CustomSequenceComponentPropValue object.
@@ -124,6 +165,8 @@ class BaseSequenceComponentNode(NamedTreeNode):
 class NonInstancedSequenceComponentNode(BaseSequenceComponentNode):
   """Class for sequence component tree nodes that do not instance other nodes."""
   
+  __slots__ = ('_component_type', '_custom_props', '_sorted_custom_prop_names')
+  
   def __init__(self, name, tree_owner, component_type=ContainerSequenceComponentType):
     """Constructor.
     The constructed node initially has no parent.
@@ -135,7 +178,12 @@ class NonInstancedSequenceComponentNode(BaseSequenceComponentNode):
     """
     super().__init__(name, tree_owner)
     self._component_type = component_type
-    self._custom_props = SortedDict()
+    self._custom_props = {}
+    
+    # Sorted tuple of the custom property names, or None if it needs to be rebuilt. Custom property bags are small and
+    # only need to be sorted when the names are listed, so a plain dict plus a lazily sorted name list is cheaper than a
+    # SortedDict.
+    self._sorted_custom_prop_names = ()
   
   @property
   def component_type(self):
@@ -147,49 +195,51 @@ class NonInstancedSequenceComponentNode(BaseSequenceComponentNode):
   
   @property
   def custom_prop_names(self):
-    return self._custom_props.keys()
+    if self._sorted_custom_prop_names is None:
+      self._sorted_custom_prop_names = tuple(sorted(self._custom_props))
+    return self._sorted_custom_prop_names
   
   def get_custom_prop(self, name):
     return self._custom_props[name]
   
   def set_custom_prop(self, name, value):
+    # Only a new name changes the name list.
+    if name not in self._custom_props:
+      self._sorted_custom_prop_names = None
     self._custom_props[name] = value
   
   def del_custom_prop(self, name):
     del self._custom_props[name]
+    self._sorted_custom_prop_names = None
   
   def make_context_menu(self, undo_stack, seq_component_tree_controller, seq_component_node_controller, parent=None):
     menu = super().make_context_menu(undo_stack, seq_component_tree_controller, seq_component_node_controller, parent)
 
-    # Add menu items for changing the component type, if that is allowed.
-    change_type_menu = menu.addMenu(QCoreApplication.translate('NonInstancedSequenceComponentNode', 'Change &Type'))
-    def change_type_func_maker(new_component_type):
-      def change_type_func():
-        undo_stack.push(SetComponentTypeCommand(seq_component_node_controller, self, new_component_type))
-      return change_type_func
-    for component_type in SUPPORTED_COMPONENT_TYPES:
-      change_type_action = change_type_menu.addAction(component_type.get_icon(), component_type.menu_text)
-      change_type_action.setEnabled(component_type != self.component_type)
-      change_type_action.triggered.connect(change_type_func_maker(component_type))
-    
-    # Add menu items for creating child nodes, if creating children is allowed.
+    # Add submenus for changing the component type and for creating child nodes, if creating children is allowed.
+    change_type_menu = menu.addMenu(CachedTranslator.translate('NonInstancedSequenceComponentNode', 'Change &Type'))
+    add_menu = None
     if self.can_have_children:
-      add_menu = menu.addMenu(QCoreApplication.translate('NonInstancedSequenceComponentNode', '&Create Child'))
-      def add_func_maker(component_type):
-        def add_func():
-          new_node = NonInstancedSequenceComponentNode(self.suggest_child_name(component_type.node_default_name),
-            component_type=component_type, tree_owner=self.tree_owner)
-          undo_stack.push(AddSequenceComponentTreeNodeCommand(seq_component_tree_controller, new_node, self))
-        return add_func
-      for component_type in SUPPORTED_COMPONENT_TYPES:
-        add_action = add_menu.addAction(component_type.get_icon(), component_type.menu_text)
-        add_action.triggered.connect(add_func_maker(component_type))
+      add_menu = menu.addMenu(CachedTranslator.translate('NonInstancedSequenceComponentNode', '&Create Child'))
+    
+    # Fill both submenus in a single pass over the supported component types.
+    current_component_type = self.component_type
+    for component_type in SUPPORTED_COMPONENT_TYPES:
+      icon = component_type.get_icon()
+      menu_text = component_type.menu_text
+      
+      change_type_action = change_type_menu.addAction(icon, menu_text)
+      change_type_action.setEnabled(component_type is not current_component_type)
+      change_type_action.triggered.connect(
+        partial(_change_component_type, undo_stack, seq_component_node_controller, self, component_type))
+      
+      if add_menu is not None:
+        add_action = add_menu.addAction(icon, menu_text)
+        add_action.triggered.connect(
+          partial(_add_child_component, undo_stack, seq_component_tree_controller, self, component_type))
     
     # Add a menu item for deleting the node, if it can be deleted.
     if self.parent is not None:
-      def delete_func():
-        undo_stack.push(DeleteSequenceComponentTreeNodeCommand(seq_component_tree_controller, self))
-      delete_action = menu.addAction(QCoreApplication.translate('NonInstancedSequenceComponentNode', '&Delete'))
-      delete_action.triggered.connect(delete_func)
+      delete_action = menu.addAction(CachedTranslator.translate('NonInstancedSequenceComponentNode', '&Delete'))
+      delete_action.triggered.connect(partial(_delete_component, undo_stack, seq_component_tree_controller, self))
     
     return menu
\ No newline at end of file
@@ -1,8 +1,8 @@
 """Defines objects representing the supported types of nodes in a sequence component tree."""
 
-from PyQt5.Qt import QIcon, QCoreApplication
+from PyQt5.Qt import QCoreApplication
 
-from scriptaseq.internal.gui.qt_util import make_multires_icon
+from scriptaseq.internal.gui.qt_util import make_multires_icon, make_blank_icon
 
 
 class BaseSequenceComponentType:
@@ -21,13 +21,13 @@ class BaseSequenceComponentType:
   # A unique name for this component type, for use in save files, etc. Subclasses should override this.
   internal_name = 'BaseComponent'
   
-  # TODO: Add a memoization decorator to this method.
   @classmethod
   def get_icon(cls):
     """Gets a QIcon representing this component type, creating it if it has not been previously created.
     This method should not be called before the Qt application's resource loading configuration has been set up.
     Subclasses should generally override make_icon instead of this method.
     """
+    # The icon helpers in qt_util already cache icons by resource path, so no separate per-class cache is needed.
     return cls.make_icon()
   
   @classmethod
@@ -36,7 +36,7 @@ class BaseSequenceComponentType:
     This method should not be called before the Qt application's resource loading configuration has been set up.
     Subclasses should override this. Default implementation returns an empty QIcon.
     """
-    return QIcon()
+    return make_blank_icon()
 
 class ContainerSequenceComponentType(BaseSequenceComponentType):
   """Sequence component node type for container nodes."""
@@ -6,7 +6,7 @@ import sys
 
 from scriptaseq.internal.gui.qml_types.registration import register_qml_types
 from scriptaseq.internal.gui.qt_ui_types.main_window import MainWindow
-from scriptaseq.internal.gui.qt_util import read_qt_resource, make_multires_icon
+from scriptaseq.internal.gui.qt_util import read_qt_resource, make_multires_icon, CachedTranslator
 
 
 # Text encoding to assume when loading the default style sheet.
@@ -34,6 +34,9 @@ def _init_translation(qt_app):
   elif not qt_app.installTranslator(app_translator):
     # TODO: Log the failure to load translation information.
     pass
+  
+  # Discard any translations that were cached before the translators were installed.
+  CachedTranslator.clear_cache()
 
 def _init_style(qt_app):
   """Sets up style information for the application.
@@ -83,6 +83,8 @@ class NamedTreeNode:
   substrings are recorded in NAME_DISALLOWED_SUBSTRINGS.
   """
   
+  __slots__ = ('_parent', '_name', '_children', '_can_have_children', '__weakref__')
+  
   def __init__(self, name, can_have_children=True, parent=None):
     """Constructor.
     Raises ValueError if the name is invalid, the parent node already has another child with the specified name, or the
@@ -234,6 +236,18 @@ class NamedTreeNode:
     if child_name in self._children:
       self._children[child_name].parent = None
   
+  def is_descendant_of(self, node):
+    """Checks whether this node is a descendant of the specified node.
+    This function does not consider a node to be a descendant of itself.
+    node -- Potential ancestor node.
+    """
+    ancestor = self._parent
+    while ancestor is not None:
+      if ancestor is node:
+        return True
+      ancestor = ancestor._parent
+    return False
+  
   def suggest_child_name(self, prefix=DEFAULT_NAME_PREFIX):
     """Suggests an available child name starting with the specified prefix.
     Raises ValueError if this node is not allowed to have children, or if the prefix is not a valid node name.
@@ -339,16 +353,17 @@ class NamedTreeNode:
     # Check if adding the child would create an inheritance cycle.
     if self is node:
       raise ValueError(QCoreApplication.translate('NamedTreeNode', 'Cannot make a node a child of itself.'))
-    if node in self.ancestors:
+    if self.is_descendant_of(node):
       raise ValueError(QCoreApplication.translate('NamedTreeNode', 'Operation would create a cycle in the tree.'))
   
   def _abs_name_path_list(self):
     """Gets the absolute path to this node, as a mutable list of node names."""
-    # For a root node, use an empty path.
-    if self.parent is None:
-      return []
-    
-    # For a non-root node, use the parent node's absolute path with this node's name appended.
-    result = self.parent._abs_name_path_list()
-    result += [self.name]
+    # Walk up the tree collecting names, then reverse them so that the path starts below the root. The root node's name
+    # is not part of the path. Iterating instead of recursing keeps deep trees clear of the recursion limit.
+    result = []
+    node = self
+    while node._parent is not None:
+      result.append(node._name)
+      node = node._parent
+    result.reverse()
     return result
\ No newline at end of file
@@ -0,0 +1,68 @@
+"""Unit tests for functionality in the scriptaseq.internal.seq_component_tree.component_tree_nodes module."""
+
+from unittest import TestCase
+
+from scriptaseq.internal.seq_component_tree.component_tree_nodes import NonInstancedSequenceComponentNode, \
+  CustomSequenceComponentPropValue
+
+
+class _InstancingTestNode(NonInstancedSequenceComponentNode):
+  """Sequence component node that reports itself as part of an instancing subtree, for testing purposes."""
+  
+  @property
+  def is_in_instance(self):
+    return True
+
+class BaseSequenceComponentNodeTest(TestCase):
+  """Unit tests for the BaseSequenceComponentNode class."""
+  
+  def setUp(self):
+    # Create a tree containing a root node, a regular child, and an instancing subtree with a grandchild.
+    self._root = NonInstancedSequenceComponentNode('root', None)
+    self._child = NonInstancedSequenceComponentNode('child', None)
+    self._child.parent = self._root
+    self._instance_root = _InstancingTestNode('instanceRoot', None)
+    self._instance_root.parent = self._root
+    self._instance_child = _InstancingTestNode('instanceChild', None)
+    self._instance_child.parent = self._instance_root
+  
+  def test_is_instance_root(self):
+    self.assertFalse(self._root.is_instance_root)
+    self.assertFalse(self._child.is_instance_root)
+    self.assertTrue(self._instance_root.is_instance_root)
+    self.assertFalse(self._instance_child.is_instance_root)
+    self.assertTrue(_InstancingTestNode('parentlessInstance', None).is_instance_root)
+
+class NonInstancedSequenceComponentNodeTest(TestCase):
+  """Unit tests for the NonInstancedSequenceComponentNode class."""
+  
+  def test_custom_prop_names(self):
+    node = NonInstancedSequenceComponentNode('node', None)
+    self.assertEqual(tuple(node.custom_prop_names), ())
+    
+    # Add a property.
+    value0 = CustomSequenceComponentPropValue('val0')
+    node.set_custom_prop('prop1', value0)
+    self.assertEqual(tuple(node.custom_prop_names), ('prop1',))
+    self.assertIs(node.get_custom_prop('prop1'), value0)
+    
+    # Overwrite the property. The names should not change.
+    value1 = CustomSequenceComponentPropValue('val1', True)
+    node.set_custom_prop('prop1', value1)
+    self.assertEqual(tuple(node.custom_prop_names), ('prop1',))
+    self.assertIs(node.get_custom_prop('prop1'), value1)
+    
+    # Add another property whose name sorts before the first one.
+    value2 = CustomSequenceComponentPropValue('val2')
+    node.set_custom_prop('prop0', value2)
+    self.assertEqual(tuple(node.custom_prop_names), ('prop0', 'prop1'))
+    self.assertIs(node.get_custom_prop('prop0'), value2)
+    
+    # Delete the first property.
+    node.del_custom_prop('prop1')
+    self.assertEqual(tuple(node.custom_prop_names), ('prop0',))
+    self.assertRaises(KeyError, node.get_custom_prop, 'prop1')
+    
+    # Deleting a missing property should fail without changing the names.
+    self.assertRaises(KeyError, node.del_custom_prop, 'prop1')
+    self.assertEqual(tuple(node.custom_prop_names), ('prop0',))
\ No newline at end of file
@@ -3,7 +3,8 @@
 from unittest import TestCase
 
 from scriptaseq.internal.project_tree.project_tree_nodes import DirProjectTreeNode, SequenceProjectTreeNode
-from scriptaseq.internal.mime_data import encode_project_tree_node_path, decode_project_tree_node_path
+from scriptaseq.internal.mime_data import encode_project_tree_node_path, decode_project_tree_node_path, \
+  encode_seq_component_tree_node_path, decode_seq_component_tree_node_path
 from scriptaseq.named_tree_node import TreeNamePath
 
 
@@ -44,4 +45,34 @@ class ProjectTreeNodePathMediaTypeTest(TestCase):
   def test_decode_fail(self):
     # Test that project tree node path decoding fails when expected.
     self.assertRaises(ValueError, decode_project_tree_node_path, 'abc/def'.encode('utf-8'))
-    self.assertRaises(ValueError, decode_project_tree_node_path, ''.encode('utf-8'))
\ No newline at end of file
+    self.assertRaises(ValueError, decode_project_tree_node_path, ''.encode('utf-8'))
+
+class SeqComponentTreeNodePathMediaTypeTest(TestCase):
+  """Unit tests for encoding and decoding of sequence component tree node paths."""
+  
+  def test_encode_decode_success(self):
+    # Test that encoded sequence component tree node paths decode to the original paths.
+    
+    paths = (TreeNamePath.from_str('/childDir0/grandchildSeq'), TreeNamePath.from_str('/abc/def'))
+    self.assertEqual(paths, decode_seq_component_tree_node_path(encode_seq_component_tree_node_path(*paths)))
+    
+    paths = (TreeNamePath.from_str('/'), TreeNamePath.from_str('/'))
+    self.assertEqual(paths, decode_seq_component_tree_node_path(encode_seq_component_tree_node_path(*paths)))
+    
+    paths = (TreeNamePath.from_str('/seq'), TreeNamePath.from_str('/'))
+    self.assertEqual(paths, decode_seq_component_tree_node_path(encode_seq_component_tree_node_path(*paths)))
+  
+  def test_encode_fail(self):
+    # Test that sequence component tree node path encoding fails when expected.
+    self.assertRaises(ValueError, encode_seq_component_tree_node_path, TreeNamePath.from_str('abc'),
+      TreeNamePath.from_str('/def'))
+    self.assertRaises(ValueError, encode_seq_component_tree_node_path, TreeNamePath.from_str('/abc'),
+      TreeNamePath.from_str('def'))
+  
+  def test_decode_fail(self):
+    # Test that sequence component tree node path decoding fails when expected.
+    self.assertRaises(ValueError, decode_seq_component_tree_node_path, b'')
+    self.assertRaises(ValueError, decode_seq_component_tree_node_path, b'\x01\x00')
+    self.assertRaises(ValueError, decode_seq_component_tree_node_path, b'\xff\x00\x00\x00/abc')
+    self.assertRaises(ValueError, decode_seq_component_tree_node_path, b'\x04\x00\x00\x00/abcdef')
+    self.assertRaises(ValueError, decode_seq_component_tree_node_path, b'\x04\x00\x00\x00abc/def')
\ No newline at end of file
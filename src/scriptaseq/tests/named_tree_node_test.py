@@ -259,6 +259,16 @@ class NamedTreeNodeTest(TestCase):
     self.assertSequenceEqual(list(self._tree_4node_grandchild.ancestors),
       [self._tree_4node_child0, self._tree_4node_root])
   
+  def test_is_descendant_of(self):
+    self.assertFalse(self._tree_1node.is_descendant_of(self._tree_1node))
+    self.assertFalse(self._tree_4node_root.is_descendant_of(self._tree_4node_root))
+    self.assertFalse(self._tree_4node_root.is_descendant_of(self._tree_4node_child0))
+    self.assertTrue(self._tree_4node_child0.is_descendant_of(self._tree_4node_root))
+    self.assertTrue(self._tree_4node_grandchild.is_descendant_of(self._tree_4node_root))
+    self.assertTrue(self._tree_4node_grandchild.is_descendant_of(self._tree_4node_child0))
+    self.assertFalse(self._tree_4node_grandchild.is_descendant_of(self._tree_4node_child1))
+    self.assertFalse(self._tree_4node_grandchild.is_descendant_of(self._tree_1node))
+  
   def test_tree_root_retrieval(self):
     self.assertIs(self._tree_1node.tree_root, self._tree_1node)
     self.assertIs(self._tree_4node_root.tree_root, self._tree_4node_root)
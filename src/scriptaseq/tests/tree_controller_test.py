@@ -0,0 +1,105 @@
+"""Unit tests for functionality in the scriptaseq.internal.project_change_controllers.tree_controller module."""
+
+from unittest import TestCase
+
+from scriptaseq.internal.project_change_controllers.tree_controller import BaseTreeController
+from scriptaseq.named_tree_node import NamedTreeNode
+
+
+class BaseTreeControllerTest(TestCase):
+  """Unit tests for the BaseTreeController class."""
+  
+  def setUp(self):
+    # Create a tree with a root node, two children, and a grandchild.
+    self._root = NamedTreeNode('root')
+    self._child0 = NamedTreeNode('child0', parent=self._root)
+    self._child1 = NamedTreeNode('child1', parent=self._root)
+    self._grandchild = NamedTreeNode('grandchild', parent=self._child0)
+    
+    # Record the signals emitted by the controller.
+    self._controller = BaseTreeController()
+    self._emitted = []
+    self._controller.active_node_changed.connect(lambda *args: self._emitted.append(('active_node_changed',) + args))
+    self._controller.node_added.connect(lambda *args: self._emitted.append(('node_added',) + args))
+    self._controller.node_deleted.connect(lambda *args: self._emitted.append(('node_deleted',) + args))
+    self._controller.node_renamed.connect(lambda *args: self._emitted.append(('node_renamed',) + args))
+    self._controller.node_reparented.connect(lambda *args: self._emitted.append(('node_reparented',) + args))
+  
+  def test_add_node(self):
+    node = NamedTreeNode('new')
+    self._controller.add_node(node, self._child1)
+    self.assertIs(node.parent, self._child1)
+    self.assertIs(self._child1.children['new'], node)
+    self.assertEqual(self._emitted, [('node_added', node)])
+  
+  def test_add_node_fail(self):
+    # Adding a node whose name is already taken should fail without changing the tree or emitting signals.
+    node = NamedTreeNode('child0')
+    self.assertRaises(ValueError, self._controller.add_node, node, self._root)
+    self.assertIsNone(node.parent)
+    self.assertIs(self._root.children['child0'], self._child0)
+    self.assertEqual(self._emitted, [])
+  
+  def test_active_node(self):
+    self._controller.active_node = self._child1
+    self.assertIs(self._controller.active_node, self._child1)
+    
+    # Setting the same active node again should not emit another signal.
+    self._controller.active_node = self._child1
+    self.assertEqual(self._emitted, [('active_node_changed', self._child1)])
+  
+  def test_delete_node(self):
+    self._controller.delete_node(self._child1)
+    self.assertIsNone(self._child1.parent)
+    self.assertNotIn('child1', self._root.children)
+    self.assertEqual(self._emitted, [('node_deleted', self._child1, self._root)])
+  
+  def test_delete_node_resets_active_node(self):
+    # Deleting an ancestor of the active node should reset the active node before the deletion is reported.
+    self._controller.active_node = self._grandchild
+    del self._emitted[:]
+    self._controller.delete_node(self._child0)
+    self.assertIsNone(self._controller.active_node)
+    self.assertEqual(self._emitted, [('active_node_changed', None), ('node_deleted', self._child0, self._root)])
+    
+    # Deleting an unrelated node should leave the active node alone.
+    self._controller.active_node = self._root
+    del self._emitted[:]
+    self._controller.delete_node(self._child1)
+    self.assertIs(self._controller.active_node, self._root)
+    self.assertEqual(self._emitted, [('node_deleted', self._child1, self._root)])
+  
+  def test_rename_node(self):
+    self._controller.rename_node(self._child0, 'renamed')
+    self.assertEqual(self._child0.name, 'renamed')
+    self.assertIs(self._root.children['renamed'], self._child0)
+    self.assertNotIn('child0', self._root.children)
+    self.assertEqual(self._emitted, [('node_renamed', self._child0, 'renamed', 'child0')])
+    
+    # Renaming a node to its current name should do nothing.
+    del self._emitted[:]
+    self._controller.rename_node(self._child0, 'renamed')
+    self.assertEqual(self._emitted, [])
+  
+  def test_rename_node_fail(self):
+    self.assertRaises(ValueError, self._controller.rename_node, self._child0, 'child1')
+    self.assertRaises(ValueError, self._controller.rename_node, self._child0, 'a/b')
+    self.assertEqual(self._child0.name, 'child0')
+    self.assertEqual(self._emitted, [])
+  
+  def test_reparent_node(self):
+    self._controller.reparent_node(self._grandchild, self._child1)
+    self.assertIs(self._grandchild.parent, self._child1)
+    self.assertNotIn('grandchild', self._child0.children)
+    self.assertEqual(self._emitted, [('node_reparented', self._grandchild, self._child1, self._child0)])
+    
+    # Reparenting a node to its current parent should do nothing.
+    del self._emitted[:]
+    self._controller.reparent_node(self._grandchild, self._child1)
+    self.assertEqual(self._emitted, [])
+  
+  def test_reparent_node_fail(self):
+    # Reparenting a node under its own descendant would create a cycle.
+    self.assertRaises(ValueError, self._controller.reparent_node, self._child0, self._grandchild)
+    self.assertIs(self._child0.parent, self._root)
+    self.assertEqual(self._emitted, [])
\ No newline at end of file
@@ -0,0 +1,168 @@
+"""Unit tests for the QUndoCommand subclasses in the scriptaseq.internal.gui.undo_commands package."""
+
+from unittest import TestCase
+
+from PyQt5.QtWidgets import QUndoStack
+
+from scriptaseq.internal.gui.qt_models.project_tree_qt_model import ProjectTreeQtModel
+from scriptaseq.internal.gui.qt_models.seq_component_custom_props_qt_model import SequenceComponentCustomPropsQtModel
+from scriptaseq.internal.gui.qt_models.seq_component_tree_qt_model import SequenceComponentTreeQtModel
+from scriptaseq.internal.gui.undo_commands.project_tree import RenameProjectTreeNodeCommand, \
+  ReparentProjectTreeNodeCommand
+from scriptaseq.internal.gui.undo_commands.seq_component_tree import RenameSequenceComponentTreeNodeCommand, \
+  ReparentSequenceComponentTreeNodeCommand
+from scriptaseq.internal.project_change_controllers.project_tree_controller import ProjectTreeController
+from scriptaseq.internal.project_change_controllers.seq_component_node_controller import SequenceComponentNodeController
+from scriptaseq.internal.project_change_controllers.seq_component_tree_controller import SequenceComponentTreeController
+from scriptaseq.internal.project_tree.project_tree_nodes import DirProjectTreeNode, SequenceProjectTreeNode
+from scriptaseq.internal.seq_component_tree.component_tree_nodes import NonInstancedSequenceComponentNode
+
+
+class ProjectTreeUndoCommandsTest(TestCase):
+  """Unit tests for the project tree undo commands."""
+  
+  def setUp(self):
+    self._root = DirProjectTreeNode('root')
+    self._node = DirProjectTreeNode('a', self._root)
+    self._dir0 = DirProjectTreeNode('dir0', self._root)
+    self._dir1 = DirProjectTreeNode('dir1', self._root)
+    
+    self._undo_stack = QUndoStack()
+    self._project_tree_controller = ProjectTreeController(self._root)
+    self._project_tree_qt_model = ProjectTreeQtModel(self._root, self._undo_stack, self._project_tree_controller)
+    self._project_tree_controller.project_tree_qt_model = self._project_tree_qt_model
+  
+  def _push_rename(self, new_name):
+    self._undo_stack.push(RenameProjectTreeNodeCommand(self._project_tree_controller, self._node, new_name))
+  
+  def _push_reparent(self, new_parent):
+    self._undo_stack.push(ReparentProjectTreeNodeCommand(self._project_tree_controller, self._node, new_parent))
+  
+  def test_try_create_no_op(self):
+    # Commands that would have no effect should not be created.
+    self.assertIsNone(RenameProjectTreeNodeCommand.try_create(self._project_tree_controller, self._node, 'a'))
+    self.assertIsNone(
+      ReparentProjectTreeNodeCommand.try_create(self._project_tree_controller, self._node, self._root))
+    self.assertIsNotNone(RenameProjectTreeNodeCommand.try_create(self._project_tree_controller, self._node, 'b'))
+    self.assertIsNotNone(
+      ReparentProjectTreeNodeCommand.try_create(self._project_tree_controller, self._node, self._dir0))
+  
+  def test_consecutive_renames_not_merged(self):
+    # Each rename should get its own undo entry, so that undoing reverts only the last one.
+    self._push_rename('x')
+    self._push_rename('y')
+    self.assertEqual(self._undo_stack.count(), 2)
+    
+    self._undo_stack.undo()
+    self.assertEqual(self._node.name, 'x')
+    self._undo_stack.undo()
+    self.assertEqual(self._node.name, 'a')
+    
+    self._undo_stack.redo()
+    self._undo_stack.redo()
+    self.assertEqual(self._node.name, 'y')
+  
+  def test_rename_and_rename_back_not_dropped(self):
+    # Renaming a node and then renaming it back should leave both renames on the undo stack.
+    self._push_rename('b')
+    self._push_rename('a')
+    self.assertEqual(self._undo_stack.count(), 2)
+    self.assertEqual(self._node.name, 'a')
+    
+    self._undo_stack.undo()
+    self.assertEqual(self._node.name, 'b')
+  
+  def test_consecutive_reparents_not_merged(self):
+    # Each move should get its own undo entry, so that undoing reverts only the last one.
+    self._push_reparent(self._dir0)
+    self._push_reparent(self._dir1)
+    self.assertEqual(self._undo_stack.count(), 2)
+    
+    self._undo_stack.undo()
+    self.assertIs(self._node.parent, self._dir0)
+    self._undo_stack.undo()
+    self.assertIs(self._node.parent, self._root)
+  
+  def test_reparent_and_reparent_back_not_dropped(self):
+    # Moving a node and then moving it back should leave both moves on the undo stack.
+    self._push_reparent(self._dir0)
+    self._push_reparent(self._root)
+    self.assertEqual(self._undo_stack.count(), 2)
+    self.assertIs(self._node.parent, self._root)
+    
+    self._undo_stack.undo()
+    self.assertIs(self._node.parent, self._dir0)
+
+class SequenceComponentTreeUndoCommandsTest(TestCase):
+  """Unit tests for the sequence component tree undo commands."""
+  
+  def setUp(self):
+    root = DirProjectTreeNode('root')
+    self._seq = SequenceProjectTreeNode('seq', root)
+    self._node = NonInstancedSequenceComponentNode('a', self._seq)
+    self._node.parent = self._seq.root_seq_component_node
+    self._container0 = NonInstancedSequenceComponentNode('container0', self._seq)
+    self._container0.parent = self._seq.root_seq_component_node
+    self._container1 = NonInstancedSequenceComponentNode('container1', self._seq)
+    self._container1.parent = self._seq.root_seq_component_node
+    
+    self._undo_stack = QUndoStack()
+    project_tree_controller = ProjectTreeController(root)
+    self._seq_component_tree_controller = SequenceComponentTreeController()
+    seq_component_node_controller = SequenceComponentNodeController()
+    self._seq_component_tree_qt_model = SequenceComponentTreeQtModel(self._undo_stack, project_tree_controller,
+      self._seq_component_tree_controller, seq_component_node_controller)
+    self._seq_component_custom_props_qt_model = SequenceComponentCustomPropsQtModel(self._undo_stack,
+      self._seq_component_tree_controller, seq_component_node_controller)
+    self._seq_component_tree_controller.seq_component_tree_qt_model = self._seq_component_tree_qt_model
+    self._seq_component_tree_controller.seq_component_custom_props_qt_model = \
+      self._seq_component_custom_props_qt_model
+  
+  def _push_rename(self, new_name):
+    self._undo_stack.push(
+      RenameSequenceComponentTreeNodeCommand(self._seq_component_tree_controller, self._node, new_name))
+  
+  def _push_reparent(self, new_parent):
+    self._undo_stack.push(ReparentSequenceComponentTreeNodeCommand(self._seq_component_tree_controller, self._node, new_parent))
+  
+  def test_consecutive_renames_not_merged(self):
+    # Each rename should get its own undo entry, so that undoing reverts only the last one.
+    self._push_rename('x')
+    self._push_rename('y')
+    self.assertEqual(self._undo_stack.count(), 2)
+    
+    self._undo_stack.undo()
+    self.assertEqual(self._node.name, 'x')
+    self._undo_stack.undo()
+    self.assertEqual(self._node.name, 'a')
+  
+  def test_rename_and_rename_back_not_dropped(self):
+    # Renaming a node and then renaming it back should leave both renames on the undo stack.
+    self._push_rename('b')
+    self._push_rename('a')
+    self.assertEqual(self._undo_stack.count(), 2)
+    self.assertEqual(self._node.name, 'a')
+    
+    self._undo_stack.undo()
+    self.assertEqual(self._node.name, 'b')
+  
+  def test_consecutive_reparents_not_merged(self):
+    # Each move should get its own undo entry, so that undoing reverts only the last one.
+    self._push_reparent(self._container0)
+    self._push_reparent(self._container1)
+    self.assertEqual(self._undo_stack.count(), 2)
+    
+    self._undo_stack.undo()
+    self.assertIs(self._node.parent, self._container0)
+    self._undo_stack.undo()
+    self.assertIs(self._node.parent, self._seq.root_seq_component_node)
+  
+  def test_reparent_and_reparent_back_not_dropped(self):
+    # Moving a node and then moving it back should leave both moves on the undo stack.
+    self._push_reparent(self._container0)
+    self._push_reparent(self._seq.root_seq_component_node)
+    self.assertEqual(self._undo_stack.count(), 2)
+    self.assertIs(self._node.parent, self._seq.root_seq_component_node)
+    
+    self._undo_stack.undo()
+    self.assertIs(self._node.parent, self._container0)
\ No newline at end of file